@@ -1,30 +1,283 @@
 """Service for handling audio operations using Deepgram."""
 
 import asyncio
+import concurrent.futures
+import json
 import logging
-from typing import Optional, Callable, Dict, Any, Union
+import threading
+import time
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, Optional, Callable, Dict, Any, List, Set, Tuple
 
 from deepgram import (
     DeepgramClient,
     DeepgramClientOptions,
     LiveTranscriptionEvents,
     LiveOptions,
-    SpeakOptions,
 )
+from websockets.asyncio.client import connect as ws_connect
+from websockets.protocol import State
 
 from translator.constants import DEEPGRAM_API_KEY
 
 logger = logging.getLogger(__name__)
 
 
+class PooledLiveConnection:
+    """A started Deepgram live connection that can be handed between sessions.
+
+    Deepgram handlers are registered once when the socket is opened and
+    dispatch to whichever session currently holds the connection.
+
+    Attributes:
+        connection (Any): The underlying Deepgram live connection.
+        source_lang (str): The language the connection transcribes.
+        created_at (float): Monotonic time at which the socket was opened.
+        released_at (float): Monotonic time at which it last went idle.
+        last_send (float): Monotonic time of the last audio or KeepAlive sent.
+        used (bool): Whether any audio has been sent over the connection.
+        healthy (bool): False once Deepgram reported an error, a close or a failed KeepAlive.
+
+    """
+
+    def __init__(self, connection: Any, source_lang: str) -> None:
+        """Wraps a (not yet started) Deepgram live connection.
+
+        Args:
+            connection (Any): The Deepgram live connection.
+            source_lang (str): The language code the connection is configured for.
+        """
+        self.connection = connection
+        self.source_lang = source_lang
+        self.created_at = time.monotonic()
+        self.released_at = self.created_at
+        self.last_send = self.created_at
+        self.used = False
+        self.healthy = True
+        self._on_message: Optional[Callable[..., None]] = None
+        self._on_error: Optional[Callable[..., None]] = None
+
+        connection.on(LiveTranscriptionEvents.Transcript, self._dispatch_transcript)
+        connection.on(LiveTranscriptionEvents.Error, self._dispatch_error)
+        connection.on(LiveTranscriptionEvents.Close, self._dispatch_close)
+
+    def bind(
+        self,
+        on_message_callback: Callable[..., None],
+        on_error_callback: Optional[Callable[..., None]] = None,
+    ) -> None:
+        """Routes transcript and error events to the given callbacks."""
+        self._on_message = on_message_callback
+        self._on_error = on_error_callback
+
+    def unbind(self) -> None:
+        """Stops routing events to the previous holder."""
+        self._on_message = None
+        self._on_error = None
+
+    def send(self, data: bytes) -> None:
+        """Sends audio to Deepgram."""
+        self.used = True
+        self.last_send = time.monotonic()
+        self.connection.send(data)
+
+    def finalize(self) -> None:
+        """Asks Deepgram to finalize the current utterance without waiting for endpointing."""
+        self.last_send = time.monotonic()
+        self.connection.finalize()
+
+    def keep_alive(self) -> bool:
+        """Sends a KeepAlive message, marking the connection dead if it fails.
+
+        Returns:
+            bool: Whether the connection is still healthy.
+        """
+        try:
+            ok = self.connection.keep_alive()
+        except Exception as e:
+            logger.warning(f"Deepgram KeepAlive failed: {e}")
+            ok = False
+
+        if ok is False:
+            self.healthy = False
+        else:
+            self.last_send = time.monotonic()
+        return self.healthy
+
+    def finish(self) -> None:
+        """Closes the underlying Deepgram connection."""
+        self.healthy = False
+        try:
+            self.connection.finish()
+        except Exception:
+            pass
+
+    def _dispatch_transcript(self, *args: Any, **kwargs: Any) -> None:
+        if self._on_message:
+            self._on_message(*args, **kwargs)
+
+    def _dispatch_error(self, *args: Any, **kwargs: Any) -> None:
+        self.healthy = False
+        if self._on_error:
+            self._on_error(*args, **kwargs)
+
+    def _dispatch_close(self, *args: Any, **kwargs: Any) -> None:
+        self.healthy = False
+
+
+class ConnectionPool:
+    """Process-wide pool of idle Deepgram live connections, keyed by language.
+
+    Only connections that never carried audio are pooled: the browser sends a
+    containerized stream, so a used socket cannot be handed to a new speaker.
+
+    Attributes:
+        max_age (float): Seconds after which a connection is never reused.
+        idle_timeout (float): Seconds a connection may sit idle in the pool.
+        max_idle (int): Maximum idle connections kept per language.
+
+    """
+
+    def __init__(self, max_age: float = 300.0, idle_timeout: float = 60.0, max_idle: int = 4) -> None:
+        """Initializes an empty pool."""
+        self.max_age = max_age
+        self.idle_timeout = idle_timeout
+        self.max_idle = max_idle
+        self._idle: Dict[str, List[PooledLiveConnection]] = {}
+        # Every open connection, idle or held, so keepalives reach all of them
+        self._live: Set[PooledLiveConnection] = set()
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        source_lang: str,
+        factory: Callable[[str], Optional[PooledLiveConnection]],
+    ) -> Optional[PooledLiveConnection]:
+        """Returns an idle connection for `source_lang`, or opens a new one.
+
+        Blocking: the factory performs the Deepgram handshake.
+
+        Args:
+            source_lang (str): The language code of the audio source.
+            factory (Callable): Opens a new connection when the pool is empty.
+
+        Returns:
+            Optional[PooledLiveConnection]: A started connection, or None if start failed.
+
+        """
+        connection = None
+        with self._lock:
+            stale = self._evict_stale()
+            idle = self._idle.get(source_lang)
+            if idle:
+                connection = idle.pop()
+
+        for expired in stale:
+            self._close(expired)
+
+        if connection is None:
+            connection = factory(source_lang)
+            if connection is not None:
+                with self._lock:
+                    self._live.add(connection)
+        return connection
+
+    def release(self, connection: PooledLiveConnection) -> None:
+        """Returns a connection to the pool, closing it if it cannot be reused.
+
+        Args:
+            connection (PooledLiveConnection): The connection to give back.
+        """
+        connection.unbind()
+        now = time.monotonic()
+
+        if connection.healthy and not connection.used and now - connection.created_at < self.max_age:
+            connection.released_at = now
+            with self._lock:
+                idle = self._idle.setdefault(connection.source_lang, [])
+                if len(idle) < self.max_idle:
+                    idle.append(connection)
+                    return
+
+        self._close(connection)
+
+    def keep_alive(self, idle_after: float) -> None:
+        """Sends a KeepAlive on every connection silent for `idle_after` seconds.
+
+        Idle connections past their idle timeout or max age are closed first,
+        so a language nobody uses any more does not keep its sockets open.
+        Blocking: the Deepgram live client sends synchronously.
+
+        Args:
+            idle_after (float): Seconds without traffic before a KeepAlive is due.
+        """
+        with self._lock:
+            stale = self._evict_stale()
+
+        for expired in stale:
+            self._close(expired)
+
+        with self._lock:
+            live = list(self._live)
+
+        now = time.monotonic()
+        for connection in live:
+            if connection.healthy and now - connection.last_send > idle_after:
+                connection.keep_alive()
+
+    def _close(self, connection: PooledLiveConnection) -> None:
+        """Finishes a connection and stops tracking it."""
+        with self._lock:
+            self._live.discard(connection)
+        connection.finish()
+
+    def _evict_stale(self) -> List[PooledLiveConnection]:
+        """Removes expired or broken idle connections. Caller holds the lock."""
+        now = time.monotonic()
+        stale = []
+        for lang, idle in self._idle.items():
+            fresh = []
+            for connection in idle:
+                if (
+                    connection.healthy
+                    and now - connection.created_at < self.max_age
+                    and now - connection.released_at < self.idle_timeout
+                ):
+                    fresh.append(connection)
+                else:
+                    stale.append(connection)
+            self._idle[lang] = fresh
+        return stale
+
+
+_stt_pool = ConnectionPool()
+
+
 class AudioService:
     """Handles audio transcription and synthesis using Deepgram.
 
     Attributes:
         client (DeepgramClient): The Deepgram client instance.
+        api_key (str): The Deepgram API key, used to authenticate TTS sockets.
 
     """
 
+    # Deepgram streaming TTS endpoint. The WebSocket API only supports raw
+    # encodings, so audio is streamed as 16-bit PCM.
+    TTS_URL = "wss://api.deepgram.com/v1/speak"
+    TTS_ENCODING = "linear16"
+    TTS_SAMPLE_RATE = 24000
+    DEFAULT_VOICE = "aura-asteria-en"
+
+    # A TTS socket that stays silent this long (no audio, no Flushed) is
+    # treated as stalled and closed. Longer than the Groq read timeout, so a
+    # slow translation upstream is not mistaken for a dead socket.
+    TTS_RECV_TIMEOUT = 15.0
+
+    # Deepgram closes live sockets after ~10s without data, so idle ones get
+    # a KeepAlive from our own task rather than the SDK's background thread.
+    KEEPALIVE_INTERVAL = 3.0
+
     # Mapping of Language Code -> Deepgram Voice Model (TTS)
     VOICE_MAPPING: Dict[str, str] = {
         "en": "aura-asteria-en",
@@ -40,42 +293,64 @@ class AudioService:
         Args:
             api_key (str): The Deepgram API key. Defaults to imported constant.
         """
-        config = DeepgramClientOptions(options={"keepalive": "true"})
-        self.client = DeepgramClient(api_key, config)
+        self.client = DeepgramClient(api_key, DeepgramClientOptions())
+        self.api_key = api_key
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # The Deepgram live client is synchronous: its handshakes, finishes and
+        # keepalives run on a bounded pool of our own instead of the default executor.
+        self._stt_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="dg-stt",
+        )
+        # Idle TTS sockets keyed by (voice_model, encoding), reused across calls
+        self._tts_sockets: Dict[Tuple[str, str], List[Any]] = {}
 
-    def create_live_transcription_connection(
-        self,
-        source_lang: str,
-        on_message_callback: Callable[[Any, Any, Any], None],
-        on_error_callback: Optional[Callable[[Any, Any, Any], None]] = None,
-    ) -> Any:
+        # TTS configuration is immutable: build each language's socket key and
+        # URL once instead of on every synthesis.
+        self._tts_headers = {"Authorization": f"Token {api_key}"}
+        self._tts_endpoints: Dict[str, Tuple[Tuple[str, str], str]] = {
+            lang: self._tts_endpoint(voice) for lang, voice in self.VOICE_MAPPING.items()
+        }
+        self._default_tts_endpoint = self._tts_endpoint(self.DEFAULT_VOICE)
+
+    def _tts_endpoint(self, voice_model: str) -> Tuple[Tuple[str, str], str]:
+        """Builds the socket pool key and streaming URL for a TTS voice.
+
+        Args:
+            voice_model (str): The Deepgram voice model.
+
+        Returns:
+            Tuple[Tuple[str, str], str]: The (voice_model, encoding) key and the URL.
+
+        """
+        url = (
+            f"{self.TTS_URL}?model={voice_model}"
+            f"&encoding={self.TTS_ENCODING}&sample_rate={self.TTS_SAMPLE_RATE}"
+        )
+        return (voice_model, self.TTS_ENCODING), url
+
+    def _open_live_connection(self, source_lang: str) -> Optional[PooledLiveConnection]:
         """Creates and starts a live transcription connection.
 
         Args:
             source_lang (str): The language code of the audio source (e.g., 'es', 'en').
-            on_message_callback (Callable): Callback function for transcript events.
-            on_error_callback (Callable, optional): Callback function for error events.
 
         Returns:
-            Any: The active Deepgram live connection object, or None if start failed.
+            Optional[PooledLiveConnection]: The started connection, or None if start failed.
 
         """
         try:
-            connection = self.client.listen.live.v("1")
-
-            # Register event handlers
-            connection.on(LiveTranscriptionEvents.Transcript, on_message_callback)
-            if on_error_callback:
-                connection.on(LiveTranscriptionEvents.Error, on_error_callback)
+            connection = PooledLiveConnection(self.client.listen.live.v("1"), source_lang)
 
             options = LiveOptions(
                 model="nova-2",
                 language=source_lang,
                 smart_format=True,
                 endpointing=350,
+                interim_results=True,
             )
 
-            if connection.start(options) is False:
+            if connection.connection.start(options) is False:
                 logger.error("Failed to start Deepgram live connection.")
                 return None
 
@@ -85,43 +360,153 @@ class AudioService:
             logger.error(f"Error creating live transcription connection: {e}")
             raise
 
-    async def synthesize_speech(self, text: str, target_lang: str) -> Optional[bytes]:
-        """Converts text to speech using Deepgram TTS.
+    async def acquire_stt(self, source_lang: str) -> Optional[PooledLiveConnection]:
+        """Takes a live transcription connection from the pool, opening one if needed.
 
         Args:
-            text (str): The text to synthesize.
-            target_lang (str): The target language code to select the voice model.
+            source_lang (str): The language code of the audio source.
 
         Returns:
-            Optional[bytes]: The audio bytes if successful, None otherwise.
+            Optional[PooledLiveConnection]: A started connection, or None if start failed.
 
         """
-        voice_model = self.VOICE_MAPPING.get(target_lang, "aura-asteria-en")
-        
-        options = SpeakOptions(
-            model=voice_model,
-            encoding="mp3",
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._stt_executor, _stt_pool.acquire, source_lang, self._open_live_connection
         )
 
+    async def release_stt(self, connection: PooledLiveConnection) -> None:
+        """Gives a live transcription connection back to the pool.
+
+        Args:
+            connection (PooledLiveConnection): The connection to release.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._stt_executor, _stt_pool.release, connection)
+
+    @property
+    def stt_max_age(self) -> float:
+        """Seconds after which a live transcription connection is never reused."""
+        return _stt_pool.max_age
+
+    def start_keepalive(self) -> None:
+        """Starts the STT keepalive task on the running loop, once per process."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.ensure_future(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        """Periodically keeps every pooled or held STT connection alive."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
+            try:
+                await loop.run_in_executor(
+                    self._stt_executor, _stt_pool.keep_alive, self.KEEPALIVE_INTERVAL
+                )
+            except Exception as e:
+                logger.error(f"Error sending Deepgram keepalives: {e}")
+
+    async def _acquire_tts_socket(self, key: Tuple[str, str], url: str) -> Any:
+        """Returns an open TTS WebSocket for the given voice, reusing idle ones.
+
+        Args:
+            key (Tuple[str, str]): The (voice_model, encoding) pool key.
+            url (str): The streaming TTS URL for that voice.
+
+        Returns:
+            Any: An open WebSocket connection to the Deepgram TTS endpoint.
+
+        """
+        idle = self._tts_sockets.get(key, [])
+        while idle:
+            ws = idle.pop()
+            if ws.state is State.OPEN:
+                return ws
+
+        return await ws_connect(url, additional_headers=self._tts_headers)
+
+    async def synthesize_speech(self, text: str, target_lang: str) -> AsyncIterator[bytes]:
+        """Converts text to speech using Deepgram streaming TTS.
+
+        Args:
+            text (str): The text to synthesize.
+            target_lang (str): The target language code to select the voice model.
+
+        Yields:
+            bytes: Raw linear16 audio chunks.
+
+        """
+        async def single() -> AsyncIterator[str]:
+            yield text
+
+        async for chunk in self.synthesize_stream(single(), target_lang):
+            yield chunk
+
+    async def synthesize_stream(
+        self, clauses: AsyncIterable[str], target_lang: str
+    ) -> AsyncIterator[bytes]:
+        """Synthesizes text clauses as they arrive, streaming the audio back.
+
+        Clauses are sent to Deepgram while earlier ones are still being
+        synthesized, so audio starts before the full text is known.
+
+        Args:
+            clauses (AsyncIterable[str]): Text fragments to speak, in order.
+            target_lang (str): The target language code to select the voice model.
+
+        Yields:
+            bytes: Raw linear16 audio chunks.
+
+        """
+        key, url = self._tts_endpoints.get(target_lang, self._default_tts_endpoint)
+
         try:
-            # We use asyncio.to_thread because the SDK might be synchronous or we want to ensure non-blocking
-            response = await asyncio.to_thread(
-                self.client.speak.v("1").stream,
-                {"text": text},
-                options
-            )
+            ws = await self._acquire_tts_socket(key, url)
+        except Exception as e:
+            logger.error(f"Error connecting to Deepgram TTS: {e}")
+            return
 
-            # Handle different possible response types from SDK
-            if hasattr(response, 'read'):
-                return response.read()
-            elif hasattr(response, 'stream') and hasattr(response.stream, 'read'):
-                return response.stream.read()
-            elif hasattr(response, 'content'):
-                return response.content
-            else:
-                logger.error(f"Unknown response format from Deepgram TTS: {type(response)}")
-                return None
+        async def speak() -> None:
+            try:
+                async for clause in clauses:
+                    await ws.send(json.dumps({"type": "Speak", "text": clause}))
+            finally:
+                await ws.send(json.dumps({"type": "Flush"}))
+
+        sender = asyncio.ensure_future(speak())
+        flushed = False
+        try:
+            while True:
+                msg = await asyncio.wait_for(ws.recv(), self.TTS_RECV_TIMEOUT)
+                if isinstance(msg, bytes):
+                    yield msg
+                elif json.loads(msg).get("type") == "Flushed":
+                    flushed = True
+                    break
+
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Deepgram TTS sent nothing for {self.TTS_RECV_TIMEOUT}s, closing socket"
+            )
 
         except Exception as e:
             logger.error(f"Error synthesizing speech: {e}")
-            return None
+
+        finally:
+            sender.cancel()
+            for result in await asyncio.gather(sender, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending text to Deepgram TTS: {result}")
+                    flushed = False
+
+            # Only a socket that finished its flush is safe to reuse
+            if flushed:
+                self._tts_sockets.setdefault(key, []).append(ws)
+            else:
+                await ws.close()
+
+
+@lru_cache(maxsize=1)
+def get_audio_service() -> AudioService:
+    """Returns the process-wide AudioService shared by all consumers."""
+    return AudioService()
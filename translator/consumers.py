@@ -1,18 +1,47 @@
 """WebSocket Consumer for real-time translation and audio streaming."""
 
+import re
 import json
 import asyncio
 import logging
-from urllib.parse import parse_qs
-from typing import Dict, Any, Optional
+from urllib.parse import unquote_plus
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Dict, Any, List, Optional
 
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 
-from .translation_service import TranslationService
-from .audio_service import AudioService
+from .translation_service import get_translation_service
+from .audio_service import get_audio_service
 
 logger = logging.getLogger(__name__)
 
+# Clause boundary in a streamed translation: punctuation followed by a space
+CLAUSE_END = re.compile(r"[.?!,]\s")
+
+async def iter_clauses(deltas: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Groups streamed translation deltas into clauses ready for TTS.
+
+    Args:
+        deltas (AsyncIterable[str]): Fragments of the translation, in order.
+
+    Yields:
+        str: Consecutive clauses, each ending at a CLAUSE_END boundary except
+        possibly the last.
+    """
+    pending = ""
+    async for delta in deltas:
+        pending += delta
+
+        boundary = None
+        for boundary in CLAUSE_END.finditer(pending):
+            pass
+        if boundary:
+            yield pending[:boundary.end()]
+            pending = pending[boundary.end():]
+
+    if pending.strip():
+        yield pending
+
 
 class TranslatorConsumer(AsyncWebsocketConsumer):
     """Consumer that handles real-time translation and audio streaming.
@@ -23,32 +52,168 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
         source_lang (str): The language spoken by the user (input).
         target_lang (str): The language the user wants to hear (output).
         app_loop (asyncio.AbstractEventLoop): The running event loop.
-        translator (TranslationService): Service for text translation.
-        audio_service (AudioService): Service for speech-to-text and text-to-speech.
+        translator (TranslationService): Shared service for text translation.
+        audio_service (AudioService): Shared service for speech-to-text and text-to-speech.
         dg_connection (Any): The active Deepgram Live connection.
     """
 
-    def _start_deepgram_connection(self):
-        """Helper to start Deepgram Live connection."""
+    # TTS audio is coalesced before going to the browser: one frame per ~8KB,
+    # or TTS_SEND_INTERVAL seconds after the first buffered byte.
+    TTS_SEND_BYTES = 8192
+    TTS_SEND_INTERVAL = 0.04
+
+    # Messages waiting for translation + TTS; the oldest is dropped when full
+    PIPELINE_QUEUE_SIZE = 4
+
+    # Final transcripts shorter than this ("Oh", "Ah") or without any letters
+    # ("...", "?") are not worth a Groq + TTS round trip. Those arriving within
+    # TRANSCRIPT_DEBOUNCE seconds of each other are broadcast together.
+    MIN_TRANSCRIPT_CHARS = 3
+    TRANSCRIPT_DEBOUNCE = 0.15
+
+    # Interim transcripts that close a sentence (or grow this long) are
+    # finalized right away instead of waiting for Deepgram's endpointing.
+    SENTENCE_END = (".", "?", "!")
+    FINALIZE_WORDS = 20
+
+    # Defaults until `connect` runs, so hot paths need no hasattr() probing
+    app_loop: Optional[asyncio.AbstractEventLoop] = None
+    dg_connection: Any = None
+    _stt_warmup: Optional["asyncio.Future[Any]"] = None
+    _warmup_expiry: Optional[asyncio.TimerHandle] = None
+    _pipeline_queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+    _pipeline_worker: Optional["asyncio.Task[None]"] = None
+    _transcript_handle: Optional[asyncio.TimerHandle] = None
+    _finalize_sent = False
+    _awaiting_mic_restart = False
+
+    async def _prewarm_connections(self) -> Any:
+        """Opens the STT socket and the Groq keep-alive connection in parallel.
+
+        Returns:
+            Any: The pooled Deepgram connection, ready to be bound on 'start_mic'.
+        """
+        stt_connection, warmed = await asyncio.gather(
+            self.audio_service.acquire_stt(self.source_lang),
+            self.translator.warm(),
+            return_exceptions=True,
+        )
+        # A failed Groq warm-up must not lose the STT connection we already hold
+        if isinstance(warmed, Exception):
+            logger.warning("Error warming up Groq connection: %s", warmed)
+        if isinstance(stt_connection, Exception):
+            raise stt_connection
+        return stt_connection
+
+    def _schedule_warmup(self, warmup: Awaitable[Any]) -> None:
+        """Starts warming an STT connection that expires if the mic stays off.
+
+        Held warm sockets are capped at the pool's max age, so idle listeners
+        do not keep a Deepgram connection open for their whole session.
+
+        Args:
+            warmup (Awaitable[Any]): Resolves to the pooled Deepgram connection.
+        """
+        self._stt_warmup = asyncio.ensure_future(warmup)
+        self._warmup_expiry = self.app_loop.call_later(
+            self.audio_service.stt_max_age, self._expire_warm_connection
+        )
+
+    def _expire_warm_connection(self) -> None:
+        """Gives back an unused warm STT connection once it reaches its max age."""
+        self._warmup_expiry = None
+        asyncio.ensure_future(self._release_warm_connection())
+
+    async def _release_warm_connection(self) -> None:
+        """Returns the pre-warmed STT connection, if any, to the pool."""
+        connection = await self._take_warm_connection()
+        if connection is not None:
+            await self.audio_service.release_stt(connection)
+
+    async def _take_warm_connection(self) -> Any:
+        """Returns the pre-warmed STT connection, if any, without binding it."""
+        if self._warmup_expiry:
+            self._warmup_expiry.cancel()
+            self._warmup_expiry = None
+        warmup, self._stt_warmup = self._stt_warmup, None
+        if warmup is None:
+            return None
+        try:
+            return await warmup
+        except Exception as e:
+            logger.error("Error pre-warming Deepgram connection: %s", e)
+            return None
+
+    async def _start_deepgram_connection(self) -> None:
+        """Helper to bind a (preferably pre-warmed) Deepgram Live connection."""
         if self.dg_connection:
             return # Ya existe, no hacer nada
 
         logger.info("🎤 Starting Deepgram Connection...")
-        self.dg_connection = self.audio_service.create_live_transcription_connection(
-            source_lang=self.source_lang,
-            on_message_callback=self._on_speech_transcript,
-            on_error_callback=self._on_speech_error
-        )
+        connection = await self._take_warm_connection()
+        if connection is not None and not connection.healthy:
+            await self.audio_service.release_stt(connection)
+            connection = None
+
+        try:
+            if connection is None:
+                connection = await self.audio_service.acquire_stt(self.source_lang)
+        except Exception as e:
+            logger.error("Error acquiring Deepgram connection: %s", e)
+            return
+
+        if connection is None:
+            return
+
+        connection.bind(self._on_speech_transcript, self._on_speech_error)
+        self.dg_connection = connection
+        self._awaiting_mic_restart = False
 
-    def _stop_deepgram_connection(self):
-        """Helper to finish Deepgram Live connection."""
+    async def _stop_deepgram_connection(self) -> None:
+        """Helper to release the Deepgram Live connection and warm up the next one."""
         if self.dg_connection:
             logger.info("🛑 Stopping Deepgram Connection...")
+            connection, self.dg_connection = self.dg_connection, None
+            self._awaiting_mic_restart = False
+            await self.audio_service.release_stt(connection)
+            self._schedule_warmup(self.audio_service.acquire_stt(self.source_lang))
+
+    async def _replace_dead_connection(self) -> None:
+        """Swaps a dead Deepgram connection for a fresh one and restarts the mic.
+
+        The dead connection stays bound until its replacement is up. The
+        browser streams WebM, so the new socket needs a fresh container
+        header: audio is dropped until the frontend confirms it restarted
+        its MediaRecorder ('mic_restarted').
+        """
+        logger.warning("Deepgram connection died, reconnecting...")
+        dead = self.dg_connection
+        try:
             try:
-                self.dg_connection.finish()
-            except Exception:
-                pass
-            self.dg_connection = None
+                connection = await self.audio_service.acquire_stt(self.source_lang)
+            except Exception as e:
+                logger.error("Error acquiring Deepgram connection: %s", e)
+                return # El próximo chunk de audio lo vuelve a intentar
+
+            if connection is None:
+                return
+
+            if self.dg_connection is not dead:
+                # The mic was stopped while we were reconnecting
+                await self.audio_service.release_stt(connection)
+                return
+
+            connection.bind(self._on_speech_transcript, self._on_speech_error)
+            self.dg_connection = connection
+            self._awaiting_mic_restart = True
+            await self.audio_service.release_stt(dead)
+
+            await self.send(text_data=orjson.dumps({
+                "type": "control",
+                "action": "restart_mic"
+            }).decode())
+        finally:
+            self._reconnect_task = None
 
     async def connect(self) -> None:
         """Handles the WebSocket connection event."""
@@ -66,12 +231,24 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
 
             # Initialize Services
             self.app_loop = asyncio.get_running_loop()
-            self.translator = TranslationService()
-            self.audio_service = AudioService()
+            # Services are process-wide: one HTTP pool and Deepgram client for all users
+            self.translator = get_translation_service()
+            self.audio_service = get_audio_service()
             
             # 🛑 CAMBIO: YA NO INICIAMOS DEEPGRAM AQUÍ AUTOMÁTICAMENTE
-            # self.dg_connection se iniciará cuando llegue la señal 'start_mic'
-            self.dg_connection = None 
+            # self.dg_connection se asignará cuando llegue la señal 'start_mic',
+            # pero los sockets (STT + Groq) se calientan ya en segundo plano.
+            self.dg_connection = None
+            self._schedule_warmup(self._prewarm_connections())
+            self._reconnect_task: Optional[asyncio.Task] = None
+            self.audio_service.start_keepalive()
+
+            # Final transcripts waiting for the debounce window to close
+            self._pending_transcripts: List[str] = []
+
+            # Translation + TTS run in a worker so broadcasts never queue behind them
+            self._pipeline_queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+            self._pipeline_worker = asyncio.ensure_future(self._run_pipeline())
 
         except Exception as e:
             logger.error("❌ Error during connection: %s", e)
@@ -89,14 +266,17 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
             self.channel_name
         )
 
-        if hasattr(self, 'dg_connection') and self.dg_connection:
-            try:
-                self.dg_connection.finish()
-            except Exception:
-                pass
-        
-        if hasattr(self, 'translator') and hasattr(self.translator, 'close'):
-            await self.translator.close()
+        if self._pipeline_worker:
+            self._pipeline_worker.cancel()
+
+        if self._transcript_handle:
+            self._transcript_handle.cancel()
+
+        await self._release_warm_connection()
+
+        if self.dg_connection:
+            await self.audio_service.release_stt(self.dg_connection)
+            self.dg_connection = None
 
     async def receive(self, text_data: Optional[str] = None, bytes_data: Optional[bytes] = None) -> None:
         """Handles incoming data from the WebSocket."""
@@ -108,25 +288,41 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
                 if data.get('type') == 'control':
                     action = data.get('action')
                     if action == 'start_mic':
-                        self._start_deepgram_connection()
+                        await self._start_deepgram_connection()
                     elif action == 'stop_mic':
-                        self._stop_deepgram_connection()
+                        await self._stop_deepgram_connection()
+                    elif action == 'mic_restarted':
+                        # From here on audio carries a fresh WebM header
+                        self._awaiting_mic_restart = False
             except json.JSONDecodeError:
                 pass
 
         # 2. MANEJO DE AUDIO (BYTES)
-        # Solo enviamos si la conexión existe y está activa
-        if bytes_data and hasattr(self, 'dg_connection') and self.dg_connection:
-            try:
-                self.dg_connection.send(bytes_data)
-            except Exception as e:
-                logger.error("Error sending to Deepgram (Connection might be closed): %s", e)
-                # Opcional: Intentar reconectar automáticamente aquí
+        # Solo enviamos si la conexión existe y está activa. El MediaRecorder
+        # ya entrega ~200ms por mensaje, así que cada chunk va tal cual.
+        if bytes_data and self.dg_connection and not self._awaiting_mic_restart:
+            self._send_audio(bytes_data)
+
+    def _send_audio(self, data: bytes) -> None:
+        """Sends one chunk of mic audio to Deepgram, reconnecting if it died."""
+        if not self.dg_connection.healthy:
+            # Headerless WebM is useless to a new socket: drop it, the mic restarts
+            if self._reconnect_task is None:
+                self._reconnect_task = asyncio.ensure_future(self._replace_dead_connection())
+            return
+
+        try:
+            self.dg_connection.send(data)
+        except Exception as e:
+            logger.error("Error sending to Deepgram (Connection might be closed): %s", e)
+            # Opcional: Intentar reconectar automáticamente aquí
 
     def _on_speech_transcript(self, connection: Any, result: Any, **kwargs: Any) -> None:
         """Callback for Deepgram transcription events.
 
-        Checks if the transcript is final and broadcasts it to the room.
+        Finalizes interim transcripts early on a sentence boundary. Checks if
+        the transcript is final and meaningful, and queues it for broadcast
+        to the room.
 
         Args:
              connection (Any): The connection object.
@@ -134,15 +330,55 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
              **kwargs (Any): Additional arguments.
         """
         is_final = result.is_final
-        sentence = result.channel.alternatives[0].transcript
+        sentence = result.channel.alternatives[0].transcript.strip()
+
+        if not is_final:
+            self._finalize_early(sentence)
+            return
+        self._finalize_sent = False
 
-        if is_final and len(sentence.strip()) > 0:
+        if (
+            len(sentence) >= self.MIN_TRANSCRIPT_CHARS
+            and any(c.isalpha() for c in sentence)
+        ):
             # When I speak, I only broadcast the ORIGINAL TEXT to the room.
-            if hasattr(self, 'app_loop') and self.app_loop:
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast_original_to_room(sentence),
-                    self.app_loop
-                )
+            if self.app_loop:
+                self.app_loop.call_soon_threadsafe(self._queue_transcript, sentence)
+
+    def _finalize_early(self, interim: str) -> None:
+        """Sends Deepgram a Finalize once an interim transcript ends a sentence.
+
+        Args:
+            interim (str): The interim transcript so far.
+        """
+        if self._finalize_sent or not interim or not self.dg_connection:
+            return
+        if interim.endswith(self.SENTENCE_END) or len(interim.split()) >= self.FINALIZE_WORDS:
+            self._finalize_sent = True
+            try:
+                self.dg_connection.finalize()
+            except Exception as e:
+                logger.error("Error sending Finalize to Deepgram: %s", e)
+
+    def _queue_transcript(self, sentence: str) -> None:
+        """Debounces final transcripts so close fragments go out as one broadcast.
+
+        Args:
+            sentence (str): A final transcript fragment.
+        """
+        self._pending_transcripts.append(sentence)
+        if self._transcript_handle:
+            self._transcript_handle.cancel()
+        self._transcript_handle = self.app_loop.call_later(
+            self.TRANSCRIPT_DEBOUNCE, self._flush_transcripts
+        )
+
+    def _flush_transcripts(self) -> None:
+        """Broadcasts the transcripts gathered during the debounce window."""
+        self._transcript_handle = None
+        text = " ".join(self._pending_transcripts)
+        self._pending_transcripts.clear()
+        asyncio.ensure_future(self.broadcast_original_to_room(text))
 
     def _on_speech_error(self, connection: Any, error: Any, **kwargs: Any) -> None:
         """Callback for Deepgram error events."""
@@ -170,7 +406,7 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
     async def chat_message(self, event: Dict[str, Any]) -> None:
         """Handles chat messages received from the group.
 
-        Triggers self-echo for the sender or translation and TTS for receivers.
+        Triggers self-echo for the sender or queues translation and TTS for receivers.
 
         Args:
             event (Dict[str, Any]): The event data containing the message.
@@ -189,36 +425,164 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
             )
             return
 
-        # B. Translation & TTS Logic (Receiver logic)
+        # B. Same language: nothing to translate or speak, just show the text
+        if sender_lang == self.target_lang:
+            await self._send_transcription_update(
+                text=original_text,
+                translation="",
+                lang=sender_lang
+            )
+            return
+
+        # C. Translation & TTS Logic (Receiver logic), handled by the pipeline worker
+        if self._pipeline_queue is None:
+            return
+        try:
+            self._pipeline_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Real-time voice: stale speech is worth less than the latest
+            self._pipeline_queue.get_nowait()
+            logger.warning("Pipeline queue full, dropping oldest message")
+            self._pipeline_queue.put_nowait(event)
+
+    async def _run_pipeline(self) -> None:
+        """Worker that translates and voices queued messages one at a time."""
+        while True:
+            event = await self._pipeline_queue.get()
+            await self._translate_and_speak(event)
+
+    async def _translate_and_speak(self, event: Dict[str, Any]) -> None:
+        """Translates a received message and streams its audio to my frontend.
+
+        Args:
+            event (Dict[str, Any]): The event data containing the message.
+        """
+        original_text = event.get("original_text", "")
+        sender_lang = event.get("source_lang", "es")
+
         # Message comes in 'sender_lang', I want 'self.target_lang'
-        
+        # 1. Translate in its own task, so it completes even if TTS fails midway
+        deltas: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        translation = asyncio.ensure_future(
+            self._translate_into(original_text, sender_lang, deltas)
+        )
+
+        results = await asyncio.gather(
+            # 2. Stream Audio (TTS) clause by clause while the translation arrives
+            self._forward_audio(
+                self.audio_service.synthesize_stream(
+                    iter_clauses(self._queued_deltas(deltas)),
+                    target_lang=self.target_lang
+                )
+            ),
+            # 3. Send the text as soon as the full translation is known
+            self._send_translation(original_text, sender_lang, translation),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("❌ Error processing translation/TTS for receiver: %s", result)
+
+    async def _translate_into(
+        self, text: str, sender_lang: str, deltas: "asyncio.Queue[Optional[str]]"
+    ) -> str:
+        """Runs the streamed translation, feeding each delta to `deltas`.
+
+        Args:
+            text (str): The original text.
+            sender_lang (str): The language code of the original text.
+            deltas (asyncio.Queue): Receives every delta, then None at the end.
+
+        Returns:
+            str: The full translation.
+        """
+        parts: List[str] = []
         try:
-            # 1. Translate (Sender's Language -> My Target Language)
-            translated_text = await self.translator.translate(
-                original_text, 
-                source_lang=sender_lang, 
+            async for delta in self.translator.translate_stream(
+                text,
+                source_lang=sender_lang,
                 target_lang=self.target_lang
-            )
+            ):
+                parts.append(delta)
+                deltas.put_nowait(delta)
+        finally:
+            deltas.put_nowait(None)
+        return "".join(parts)
+
+    @staticmethod
+    async def _queued_deltas(deltas: "asyncio.Queue[Optional[str]]") -> AsyncIterator[str]:
+        """Yields translation deltas from the queue until the end marker."""
+        while True:
+            delta = await deltas.get()
+            if delta is None:
+                return
+            yield delta
+
+    async def _send_translation(
+        self, text: str, sender_lang: str, translation: "asyncio.Future[str]"
+    ) -> None:
+        """Sends the transcription update once the translation task completes.
 
-            # 2. Generate Audio (TTS) in My Target Language
-            audio_bytes = await self.audio_service.synthesize_speech(
-                translated_text,
-                target_lang=self.target_lang
-            )
+        Args:
+            text (str): The original text.
+            sender_lang (str): The language code of the original text.
+            translation (asyncio.Future[str]): The running translation task.
+        """
+        await self._send_transcription_update(
+            text=text,
+            translation=await translation,
+            lang=sender_lang
+        )
 
-            # 3. Send to My Frontend
-            if audio_bytes:
-                # First, metadata
-                await self._send_transcription_update(
-                    text=original_text,
-                    translation=translated_text,
-                    lang=sender_lang
-                )
-                # Second, audio
-                await self.send(bytes_data=audio_bytes)
+    async def _forward_audio(self, chunks: AsyncGenerator[bytes, None]) -> None:
+        """Sends TTS audio to the frontend, coalescing small chunks.
 
-        except Exception as e:
-            logger.error("❌ Error processing translation/TTS for receiver: %s", e)
+        A frame goes out once TTS_SEND_BYTES are buffered or TTS_SEND_INTERVAL
+        has passed since its first byte, even if Deepgram is still pausing
+        between clauses.
+
+        Args:
+            chunks (AsyncGenerator[bytes, None]): Audio chunks as produced by the TTS stream.
+        """
+        buf = bytearray()
+        deadline: Optional[float] = None
+        next_chunk: Optional["asyncio.Future[bytes]"] = None
+
+        try:
+            while True:
+                if next_chunk is None:
+                    next_chunk = asyncio.ensure_future(chunks.__anext__())
+
+                timeout = None if deadline is None else max(0.0, deadline - self.app_loop.time())
+                done, _ = await asyncio.wait({next_chunk}, timeout=timeout)
+
+                if done:
+                    task, next_chunk = next_chunk, None
+                    try:
+                        chunk = task.result()
+                    except StopAsyncIteration:
+                        break
+
+                    if not buf:
+                        deadline = self.app_loop.time() + self.TTS_SEND_INTERVAL
+                    buf.extend(chunk)
+                    if len(buf) < self.TTS_SEND_BYTES and self.app_loop.time() < deadline:
+                        continue
+
+                await self.send(bytes_data=bytes(buf))
+                buf.clear()
+                deadline = None
+
+            if buf:
+                await self.send(bytes_data=bytes(buf))
+
+        finally:
+            if next_chunk is not None:
+                next_chunk.cancel()
+                # Let the cancelled step unwind before closing the generator
+                await asyncio.gather(next_chunk, return_exceptions=True)
+            # Close the TTS socket / sender now rather than whenever GC runs
+            await chunks.aclose()
 
     async def _send_transcription_update(self, text: str, translation: str, lang: str) -> None:
         """Helper to send JSON transcription/translation updates to the frontend.
@@ -229,18 +593,20 @@ class TranslatorConsumer(AsyncWebsocketConsumer):
             lang: The language code of the original text.
 
         """
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=orjson.dumps({
             "type": "transcription",
             "text": text,
             "translation": translation,
             "lang": lang
-        }))
+        }).decode())
 
     def _parse_query_params(self) -> None:
         """Extracts room name and languages from the WebSocket scope."""
         self.room_name = self.scope['url_route']['kwargs']['room_name']
-        query_string = self.scope['query_string'].decode()
-        params = parse_qs(query_string)
+        params: Dict[str, str] = {}
+        for pair in self.scope['query_string'].decode().split('&'):
+            key, _, value = pair.partition('=')
+            params.setdefault(key, unquote_plus(value))
         
-        self.source_lang = params.get('source', ['es'])[0] # Default to Spanish
-        self.target_lang = params.get('target', ['en'])[0] # Default to English
+        self.source_lang = params.get('source') or 'es' # Default to Spanish
+        self.target_lang = params.get('target') or 'en' # Default to English
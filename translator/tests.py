@@ -1,3 +1,730 @@
-from django.test import TestCase
+"""Unit tests for the translator's building blocks.
 
-# Create your tests here.
+Deepgram and Groq are replaced by small in-memory stubs, so these tests never
+touch the network.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from websockets.protocol import State
+
+from translator.audio_service import AudioService, ConnectionPool, PooledLiveConnection
+from translator.consumers import TranslatorConsumer, iter_clauses
+from translator.translation_service import TranslationService
+
+
+async def collect(iterator: Any) -> List[Any]:
+    return [item async for item in iterator]
+
+
+async def from_list(items: List[Any]) -> Any:
+    for item in items:
+        yield item
+
+
+class FakeTtsSocket:
+    """Stands in for a Deepgram TTS WebSocket: each Speak comes back as audio.
+
+    `on_flush` picks how it answers a Flush: "flushed", "close" (Deepgram hung
+    up mid-flush) or "stall" (never answers).
+    """
+
+    def __init__(self, on_flush: str = "flushed") -> None:
+        self.state = State.OPEN
+        self.sent: List[Dict[str, Any]] = []
+        self.on_flush = on_flush
+        self._incoming: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        payload = json.loads(message)
+        self.sent.append(payload)
+        if payload["type"] == "Speak":
+            self._incoming.put_nowait(payload["text"].encode())
+        elif self.on_flush == "flushed":
+            self._incoming.put_nowait(json.dumps({"type": "Flushed"}))
+        elif self.on_flush == "close":
+            self._incoming.put_nowait(None)
+
+    async def close(self) -> None:
+        self.state = State.CLOSED
+        self._incoming.put_nowait(None)
+
+    async def recv(self) -> Any:
+        message = await self._incoming.get()
+        if message is None:
+            raise ConnectionError("socket closed")
+        return message
+
+
+class SpeechSynthesisTests(SimpleTestCase):
+    """Streaming TTS over Deepgram's speak WebSocket."""
+
+    def setUp(self) -> None:
+        self.sockets: List[FakeTtsSocket] = []
+        self.urls: List[str] = []
+        self.on_flush = "flushed"
+        patcher = mock.patch("translator.audio_service.ws_connect", self.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = AudioService(api_key="test-key")
+
+    async def connect(self, url: str, **kwargs: Any) -> FakeTtsSocket:
+        socket = FakeTtsSocket(on_flush=self.on_flush)
+        self.sockets.append(socket)
+        self.urls.append(url)
+        return socket
+
+    async def test_audio_streams_until_flushed(self) -> None:
+        chunks = await collect(self.service.synthesize_speech("Hola", "es"))
+
+        self.assertEqual(chunks, [b"Hola"])
+        self.assertEqual([m["type"] for m in self.sockets[0].sent], ["Speak", "Flush"])
+        self.assertIn("model=aura-2-celeste-es", self.urls[0])
+
+    async def test_flushed_socket_is_reused(self) -> None:
+        await collect(self.service.synthesize_speech("Hola", "es"))
+        await collect(self.service.synthesize_speech("Adios", "es"))
+
+        self.assertEqual(len(self.sockets), 1)
+        self.assertEqual(self.sockets[0].state, State.OPEN)
+
+    async def test_socket_without_flush_is_closed(self) -> None:
+        self.on_flush = "close"
+        await collect(self.service.synthesize_speech("Hola", "es"))
+        self.assertEqual(self.sockets[0].state, State.CLOSED)
+
+        self.on_flush = "flushed"
+        await collect(self.service.synthesize_speech("Hola", "es"))
+        self.assertEqual(len(self.sockets), 2)
+
+    async def test_stalled_socket_is_closed_after_timeout(self) -> None:
+        self.on_flush = "stall"
+        self.service.TTS_RECV_TIMEOUT = 0.05
+
+        chunks = await collect(self.service.synthesize_speech("Hola", "es"))
+
+        self.assertEqual(chunks, [b"Hola"])
+        self.assertEqual(self.sockets[0].state, State.CLOSED)
+
+    async def test_closed_idle_socket_is_replaced(self) -> None:
+        await collect(self.service.synthesize_speech("Hola", "es"))
+        self.sockets[0].state = State.CLOSED
+
+        self.assertEqual(await collect(self.service.synthesize_speech("Hola", "es")), [b"Hola"])
+        self.assertEqual(len(self.sockets), 2)
+
+    async def test_each_clause_is_spoken_before_a_single_flush(self) -> None:
+        chunks = await collect(self.service.synthesize_stream(from_list(["Hola, ", "amigos."]), "es"))
+
+        self.assertEqual(chunks, [b"Hola, ", b"amigos."])
+        self.assertEqual([m["type"] for m in self.sockets[0].sent], ["Speak", "Speak", "Flush"])
+
+    async def test_socket_is_not_reused_when_clauses_fail(self) -> None:
+        async def clauses():
+            yield "Hola, "
+            raise RuntimeError("translation failed")
+
+        await collect(self.service.synthesize_stream(clauses(), "es"))
+        self.assertEqual(self.sockets[0].state, State.CLOSED)
+
+
+class StubLiveClient:
+    """Stands in for the Deepgram live client."""
+
+    def __init__(self, keep_alive_result: bool = True) -> None:
+        self.handlers: Dict[Any, Any] = {}
+        self.sent: List[bytes] = []
+        self.finished = False
+        self.keepalives = 0
+        self.keep_alive_result = keep_alive_result
+        self.finalized = 0
+
+    def on(self, event: Any, handler: Any) -> None:
+        self.handlers[event] = handler
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def finish(self) -> None:
+        self.finished = True
+
+    def keep_alive(self) -> bool:
+        self.keepalives += 1
+        return self.keep_alive_result
+
+    def finalize(self) -> None:
+        self.finalized += 1
+
+
+def make_connection(lang: str = "es", **kwargs: Any) -> PooledLiveConnection:
+    return PooledLiveConnection(StubLiveClient(**kwargs), lang)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    """Acquire / release / eviction rules of the STT connection pool."""
+
+    def setUp(self) -> None:
+        self.opened: List[PooledLiveConnection] = []
+
+    def factory(self, lang: str) -> PooledLiveConnection:
+        connection = make_connection(lang)
+        self.opened.append(connection)
+        return connection
+
+    def test_acquire_opens_connection_when_pool_is_empty(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", self.factory)
+        self.assertIs(connection, self.opened[0])
+        self.assertEqual(connection.source_lang, "es")
+
+    def test_unused_connection_is_reused(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", self.factory)
+        pool.release(connection)
+
+        self.assertIs(pool.acquire("es", self.factory), connection)
+        self.assertEqual(len(self.opened), 1)
+        self.assertFalse(connection.connection.finished)
+
+    def test_pool_is_keyed_by_language(self) -> None:
+        pool = ConnectionPool()
+        pool.release(pool.acquire("es", self.factory))
+
+        self.assertEqual(pool.acquire("en", self.factory).source_lang, "en")
+        self.assertEqual(len(self.opened), 2)
+
+    def test_used_connection_is_closed_on_release(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", self.factory)
+        connection.send(b"audio")
+        pool.release(connection)
+
+        self.assertTrue(connection.connection.finished)
+        self.assertIsNot(pool.acquire("es", self.factory), connection)
+
+    def test_connection_past_max_age_is_closed_on_release(self) -> None:
+        pool = ConnectionPool(max_age=0.0)
+        connection = pool.acquire("es", self.factory)
+        pool.release(connection)
+        self.assertTrue(connection.connection.finished)
+
+    def test_idle_connection_is_evicted(self) -> None:
+        pool = ConnectionPool(idle_timeout=0.0)
+        connection = pool.acquire("es", self.factory)
+        pool.release(connection)
+
+        self.assertIsNot(pool.acquire("es", self.factory), connection)
+        self.assertTrue(connection.connection.finished)
+
+    def test_unhealthy_connection_is_evicted(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", self.factory)
+        pool.release(connection)
+        connection.healthy = False
+
+        self.assertIsNot(pool.acquire("es", self.factory), connection)
+        self.assertTrue(connection.connection.finished)
+
+    def test_released_connection_stops_dispatching(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", self.factory)
+        received: List[Any] = []
+        connection.bind(lambda *args, **kwargs: received.append(kwargs["result"]))
+
+        connection._dispatch_transcript(None, result="hola")
+        pool.release(connection)
+        connection._dispatch_transcript(None, result="adios")
+
+        self.assertEqual(received, ["hola"])
+
+    def test_keep_alive_only_targets_quiet_connections(self) -> None:
+        pool = ConnectionPool()
+        quiet = pool.acquire("es", self.factory)
+        busy = pool.acquire("es", self.factory)
+        quiet.last_send = time.monotonic() - 10
+
+        pool.keep_alive(3.0)
+
+        self.assertEqual(quiet.connection.keepalives, 1)
+        self.assertEqual(busy.connection.keepalives, 0)
+
+    def test_failed_keep_alive_marks_connection_dead(self) -> None:
+        pool = ConnectionPool()
+        connection = pool.acquire("es", lambda lang: make_connection(lang, keep_alive_result=False))
+        connection.last_send = time.monotonic() - 10
+
+        pool.keep_alive(3.0)
+
+        self.assertFalse(connection.healthy)
+
+    def test_keep_alive_closes_idle_connections_past_their_timeout(self) -> None:
+        pool = ConnectionPool(idle_timeout=0.0)
+        connection = pool.acquire("es", self.factory)
+        connection.last_send = time.monotonic() - 10
+        pool.release(connection)
+
+        pool.keep_alive(3.0)
+
+        self.assertTrue(connection.connection.finished)
+        self.assertEqual(connection.connection.keepalives, 0)
+
+
+class StubGroq:
+    """Stands in for AsyncGroq, answering with a canned translation."""
+
+    def __init__(self, deltas: List[str], fail: bool = False) -> None:
+        self.deltas = deltas
+        self.fail = fail
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("groq down")
+        if not kwargs.get("stream"):
+            message = SimpleNamespace(content="".join(self.deltas))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        async def stream():
+            for delta in self.deltas:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+        return stream()
+
+
+class TranslationCacheTests(SimpleTestCase):
+    """The in-memory LRU in front of Groq."""
+
+    def setUp(self) -> None:
+        self.service = TranslationService()
+        self.groq = StubGroq(["Hello", " friends"])
+        self.service.client = self.groq
+
+    def tearDown(self) -> None:
+        async_to_sync(self.service.close)()
+
+    async def test_repeated_phrase_is_served_from_cache(self) -> None:
+        first = await self.service.translate("Hola amigos", "es", "en")
+        second = await self.service.translate("  hola AMIGOS ", "es", "en")
+
+        self.assertEqual(first, "Hello friends")
+        self.assertEqual(second, "Hello friends")
+        self.assertEqual(self.groq.calls, 1)
+
+    async def test_cache_evicts_least_recently_used(self) -> None:
+        self.service.CACHE_SIZE = 2
+        await self.service.translate("uno", "es", "en")
+        await self.service.translate("dos", "es", "en")
+        await self.service.translate("uno", "es", "en")  # refreshes "uno"
+        await self.service.translate("tres", "es", "en")  # evicts "dos"
+        self.assertEqual(self.groq.calls, 3)
+
+        await self.service.translate("uno", "es", "en")
+        self.assertEqual(self.groq.calls, 3)
+        await self.service.translate("dos", "es", "en")
+        self.assertEqual(self.groq.calls, 4)
+
+    async def test_cache_is_keyed_by_language_pair(self) -> None:
+        await self.service.translate("Hola", "es", "en")
+        await self.service.translate("Hola", "es", "fr")
+        self.assertEqual(self.groq.calls, 2)
+
+    async def test_failed_translation_falls_back_and_is_not_cached(self) -> None:
+        self.service.client = failing = StubGroq([], fail=True)
+
+        self.assertEqual(await self.service.translate("Hola", "es", "en"), "Hola")
+        await self.service.translate("Hola", "es", "en")
+        self.assertEqual(failing.calls, 2)
+
+    async def test_same_language_skips_groq(self) -> None:
+        self.assertEqual(await self.service.translate("Hola", "es", "es"), "Hola")
+        self.assertEqual(self.groq.calls, 0)
+
+
+class ClauseSplittingTests(SimpleTestCase):
+    """iter_clauses cuts at punctuation followed by whitespace."""
+
+    async def test_splits_on_clause_boundaries_across_deltas(self) -> None:
+        clauses = await collect(iter_clauses(from_list(["Hello, wor", "ld. How", " are you?"])))
+        self.assertEqual(clauses, ["Hello, ", "world. ", "How are you?"])
+
+    async def test_punctuation_inside_numbers_is_not_a_boundary(self) -> None:
+        clauses = await collect(iter_clauses(from_list(["It costs 1,000", ".50 dollars"])))
+        self.assertEqual(clauses, ["It costs 1,000.50 dollars"])
+
+    async def test_trailing_whitespace_is_dropped(self) -> None:
+        clauses = await collect(iter_clauses(from_list(["Done. ", "  "])))
+        self.assertEqual(clauses, ["Done. "])
+
+
+def make_consumer(**attrs: Any) -> TranslatorConsumer:
+    consumer = TranslatorConsumer()
+    consumer.app_loop = asyncio.get_running_loop()
+    for name, value in attrs.items():
+        setattr(consumer, name, value)
+    return consumer
+
+
+def record_sends(consumer: TranslatorConsumer) -> List[Dict[str, Any]]:
+    """Replaces `consumer.send` with a recorder and returns what it records."""
+    sent: List[Dict[str, Any]] = []
+
+    async def send(**kwargs: Any) -> None:
+        sent.append(kwargs)
+
+    consumer.send = send
+    return sent
+
+
+class StubTranslator:
+    """Streams a canned translation, one word per delta."""
+
+    def __init__(self, translation: str) -> None:
+        self.translation = translation
+        self.calls = 0
+
+    async def translate_stream(self, text: str, source_lang: str, target_lang: str) -> Any:
+        self.calls += 1
+        for word in self.translation.split(" "):
+            yield word + " "
+
+
+class ReceiverPipelineTests(SimpleTestCase):
+    """Translation + TTS for messages spoken by someone else."""
+
+    event = {"original_text": "Hola amigos", "source_lang": "es", "sender_channel_name": "other"}
+
+    def make_consumer(self, synthesize_stream: Any) -> TranslatorConsumer:
+        return make_consumer(
+            channel_name="me",
+            target_lang="en",
+            translator=StubTranslator("Hello friends."),
+            audio_service=SimpleNamespace(synthesize_stream=synthesize_stream),
+        )
+
+    async def test_audio_and_transcription_reach_the_listener(self) -> None:
+        async def synthesize_stream(clauses: Any, target_lang: str) -> Any:
+            async for clause in clauses:
+                yield clause.encode()
+
+        consumer = self.make_consumer(synthesize_stream)
+        sent = record_sends(consumer)
+        await consumer._translate_and_speak(self.event)
+
+        self.assertEqual(b"".join(s["bytes_data"] for s in sent if "bytes_data" in s), b"Hello friends. ")
+        update = json.loads(next(s["text_data"] for s in sent if "text_data" in s))
+        self.assertEqual(update["translation"], "Hello friends. ")
+
+    async def test_transcription_is_sent_when_tts_fails(self) -> None:
+        async def synthesize_stream(clauses: Any, target_lang: str) -> Any:
+            async for _ in clauses:
+                raise ConnectionError("TTS socket dropped")
+            yield b""
+
+        consumer = self.make_consumer(synthesize_stream)
+        sent = record_sends(consumer)
+        await consumer._translate_and_speak(self.event)
+
+        update = json.loads(next(s["text_data"] for s in sent if "text_data" in s))
+        self.assertEqual(update["translation"], "Hello friends. ")
+
+    async def test_same_language_message_is_shown_without_translation(self) -> None:
+        consumer = self.make_consumer(None)
+        sent = record_sends(consumer)
+        await consumer.chat_message({**self.event, "source_lang": "en"})
+
+        self.assertEqual(consumer.translator.calls, 0)
+        self.assertEqual([json.loads(s["text_data"])["translation"] for s in sent], [""])
+
+
+class StubChannelLayer:
+    """Records group membership changes and group sends."""
+
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    async def group_add(self, group: str, channel: str) -> None:
+        self.calls.append(("add", group, channel))
+
+    async def group_discard(self, group: str, channel: str) -> None:
+        self.calls.append(("discard", group, channel))
+
+    async def group_send(self, group: str, event: Dict[str, Any]) -> None:
+        self.calls.append(("send", group, event))
+
+
+class RoomBroadcastTests(SimpleTestCase):
+    """Every participant of a room shares a single channel layer group."""
+
+    async def test_broadcast_is_a_single_group_send_to_the_room(self) -> None:
+        layer = StubChannelLayer()
+        consumer = make_consumer(
+            channel_layer=layer,
+            channel_name="speaker",
+            room_group_name="room_lobby_global",
+            source_lang="es",
+        )
+
+        await consumer.broadcast_original_to_room("Hola")
+
+        self.assertEqual(len(layer.calls), 1)
+        action, group, event = layer.calls[0]
+        self.assertEqual((action, group), ("send", "room_lobby_global"))
+        self.assertEqual(event["original_text"], "Hola")
+        self.assertEqual(event["sender_channel_name"], "speaker")
+
+    async def test_disconnect_leaves_the_room_group(self) -> None:
+        layer = StubChannelLayer()
+        consumer = make_consumer(
+            channel_layer=layer,
+            channel_name="listener",
+            room_group_name="room_lobby_global",
+        )
+
+        await consumer.disconnect(1000)
+
+        self.assertEqual(layer.calls, [("discard", "room_lobby_global", "listener")])
+
+
+def make_mic_consumer(**attrs: Any) -> TranslatorConsumer:
+    return make_consumer(dg_connection=make_connection(), _reconnect_task=None, **attrs)
+
+
+class MicForwardingTests(SimpleTestCase):
+    """Mic frames go straight to Deepgram; the browser already batches them."""
+
+    async def test_each_frame_is_sent_as_is(self) -> None:
+        consumer = make_mic_consumer()
+        for size in (1000, 1200):
+            await consumer.receive(bytes_data=b"a" * size)
+        self.assertEqual([len(f) for f in consumer.dg_connection.connection.sent], [1000, 1200])
+
+    async def test_forwarding_leaves_the_pipeline_worker_running(self) -> None:
+        worker = asyncio.ensure_future(asyncio.sleep(10))
+        consumer = make_mic_consumer(_pipeline_worker=worker)
+        try:
+            await consumer.receive(bytes_data=b"a" * 1000)
+            await asyncio.sleep(0)
+            self.assertFalse(worker.cancelled())
+        finally:
+            worker.cancel()
+
+    async def test_forwarding_leaves_the_debounce_timer_armed(self) -> None:
+        consumer = make_mic_consumer()
+        consumer._transcript_handle = handle = consumer.app_loop.call_later(10, lambda: None)
+        try:
+            await consumer.receive(bytes_data=b"a" * 1000)
+            self.assertFalse(handle.cancelled())
+        finally:
+            handle.cancel()
+
+
+class StubSttService:
+    """Hands out fresh live connections and records the released ones."""
+
+    def __init__(self) -> None:
+        self.released: List[PooledLiveConnection] = []
+
+    async def acquire_stt(self, source_lang: str) -> PooledLiveConnection:
+        return make_connection(source_lang)
+
+    async def release_stt(self, connection: PooledLiveConnection) -> None:
+        self.released.append(connection)
+
+
+class DeadConnectionTests(SimpleTestCase):
+    """Recovery from an STT connection that Deepgram dropped."""
+
+    async def test_dead_connection_is_replaced_and_mic_restarted(self) -> None:
+        consumer = make_mic_consumer(source_lang="es", audio_service=StubSttService())
+        dead = consumer.dg_connection
+        dead.healthy = False
+        sent = record_sends(consumer)
+
+        await consumer.receive(bytes_data=b"a" * 1000)
+        await consumer._reconnect_task
+
+        self.assertIsNot(consumer.dg_connection, dead)
+        self.assertEqual(consumer.audio_service.released, [dead])
+        self.assertEqual(dead.connection.sent, [])
+        self.assertEqual(json.loads(sent[0]["text_data"])["action"], "restart_mic")
+
+    async def test_audio_is_dropped_until_mic_restarts(self) -> None:
+        consumer = make_mic_consumer(_awaiting_mic_restart=True)
+        await consumer.receive(bytes_data=b"a" * 1000)
+        self.assertEqual(consumer.dg_connection.connection.sent, [])
+
+        await consumer.receive(text_data='{"type": "control", "action": "mic_restarted"}')
+        await consumer.receive(bytes_data=b"a" * 1000)
+        self.assertEqual(len(consumer.dg_connection.connection.sent), 1)
+
+
+class TtsCoalescingTests(SimpleTestCase):
+    """TTS chunks are batched into larger WebSocket frames."""
+
+    async def test_chunks_are_grouped_by_size_and_deadline(self) -> None:
+        consumer = make_consumer()
+        sent = record_sends(consumer)
+
+        async def chunks():
+            for _ in range(10):
+                yield b"x" * 1000
+            await asyncio.sleep(consumer.TTS_SEND_INTERVAL * 5)
+            yield b"y" * 500
+
+        await consumer._forward_audio(chunks())
+        self.assertEqual([len(s["bytes_data"]) for s in sent], [9000, 1000, 500])
+
+    async def test_stream_is_closed_when_sending_fails(self) -> None:
+        consumer = make_consumer()
+        closed: List[bool] = []
+
+        async def broken_send(**kwargs: Any) -> None:
+            raise ConnectionError("browser went away")
+
+        async def chunks():
+            try:
+                while True:
+                    yield b"x" * consumer.TTS_SEND_BYTES
+            finally:
+                closed.append(True)
+
+        consumer.send = broken_send
+        with self.assertRaises(ConnectionError):
+            await consumer._forward_audio(chunks())
+        self.assertEqual(closed, [True])
+
+
+class QueryParamsTests(SimpleTestCase):
+    """TranslatorConsumer._parse_query_params."""
+
+    def parse(self, query_string: bytes) -> TranslatorConsumer:
+        consumer = TranslatorConsumer()
+        consumer.scope = {
+            "url_route": {"kwargs": {"room_name": "sala"}},
+            "query_string": query_string,
+        }
+        consumer._parse_query_params()
+        return consumer
+
+    def test_reads_room_and_languages(self) -> None:
+        consumer = self.parse(b"source=fr&target=de")
+        self.assertEqual(
+            (consumer.room_name, consumer.source_lang, consumer.target_lang),
+            ("sala", "fr", "de"),
+        )
+
+    def test_defaults_when_missing_or_empty(self) -> None:
+        consumer = self.parse(b"source=&other=1")
+        self.assertEqual((consumer.source_lang, consumer.target_lang), ("es", "en"))
+
+    def test_first_value_wins_and_values_are_unquoted(self) -> None:
+        consumer = self.parse(b"target=p%74&target=en")
+        self.assertEqual(consumer.target_lang, "pt")
+
+
+class PipelineQueueTests(SimpleTestCase):
+    """chat_message hands receiver work to a bounded, drop-oldest queue."""
+
+    async def test_full_queue_drops_the_oldest_message(self) -> None:
+        consumer = make_consumer(channel_name="me", target_lang="en", _pipeline_queue=asyncio.Queue(maxsize=2))
+        events = [
+            {"original_text": text, "source_lang": "es", "sender_channel_name": "other"}
+            for text in ("uno", "dos", "tres")
+        ]
+        for event in events:
+            await consumer.chat_message(event)
+
+        queued = [consumer._pipeline_queue.get_nowait() for _ in range(consumer._pipeline_queue.qsize())]
+        self.assertEqual(queued, events[1:])
+
+    async def test_sender_echo_bypasses_the_queue(self) -> None:
+        consumer = make_consumer(channel_name="me", target_lang="en", _pipeline_queue=asyncio.Queue(maxsize=2))
+        sent = record_sends(consumer)
+        await consumer.chat_message({"original_text": "Hola", "source_lang": "es", "sender_channel_name": "me"})
+
+        self.assertTrue(consumer._pipeline_queue.empty())
+        self.assertEqual(json.loads(sent[0]["text_data"])["text"], "Hola")
+
+
+def final(transcript: str, is_final: bool = True) -> Any:
+    return SimpleNamespace(
+        is_final=is_final,
+        channel=SimpleNamespace(alternatives=[SimpleNamespace(transcript=transcript)]),
+    )
+
+
+class TranscriptDebounceTests(SimpleTestCase):
+    """Final transcripts are filtered and debounced before broadcasting."""
+
+    def make_consumer(self) -> TranslatorConsumer:
+        consumer = make_consumer(_pending_transcripts=[])
+        consumer.broadcasts = []
+
+        async def broadcast(text: str) -> None:
+            consumer.broadcasts.append(text)
+
+        consumer.broadcast_original_to_room = broadcast
+        return consumer
+
+    async def settle(self, consumer: TranslatorConsumer) -> None:
+        await asyncio.sleep(consumer.TRANSCRIPT_DEBOUNCE + 0.05)
+
+    async def test_close_fragments_are_broadcast_together(self) -> None:
+        consumer = self.make_consumer()
+        consumer._queue_transcript("Hola")
+        consumer._queue_transcript("amigos")
+        await self.settle(consumer)
+        self.assertEqual(consumer.broadcasts, ["Hola amigos"])
+
+    async def test_separate_fragments_are_broadcast_separately(self) -> None:
+        consumer = self.make_consumer()
+        consumer._queue_transcript("Hola")
+        await self.settle(consumer)
+        consumer._queue_transcript("amigos")
+        await self.settle(consumer)
+        self.assertEqual(consumer.broadcasts, ["Hola", "amigos"])
+
+    async def test_short_or_letterless_transcripts_are_skipped(self) -> None:
+        consumer = self.make_consumer()
+        for transcript in ("Oh", "...", " ?! ", "No."):
+            consumer._on_speech_transcript(None, result=final(transcript))
+        await self.settle(consumer)
+        self.assertEqual(consumer.broadcasts, ["No."])
+
+
+class FinalizeEarlyTests(SimpleTestCase):
+    """Interim transcripts that close a sentence are finalized right away."""
+
+    def make_consumer(self) -> TranslatorConsumer:
+        # Final transcripts are not under test here, keep them out of the debounce
+        return make_consumer(dg_connection=make_connection(), _queue_transcript=lambda sentence: None)
+
+    async def test_sentence_end_finalizes_once_per_utterance(self) -> None:
+        consumer = self.make_consumer()
+        consumer._on_speech_transcript(None, result=final("Hola amigos.", is_final=False))
+        consumer._on_speech_transcript(None, result=final("Hola amigos. Que", is_final=False))
+        self.assertEqual(consumer.dg_connection.connection.finalized, 1)
+
+        consumer._on_speech_transcript(None, result=final("Hola amigos."))
+        consumer._on_speech_transcript(None, result=final("Adios?", is_final=False))
+        self.assertEqual(consumer.dg_connection.connection.finalized, 2)
+
+    async def test_long_interim_is_finalized(self) -> None:
+        consumer = self.make_consumer()
+        words = " ".join(["palabra"] * consumer.FINALIZE_WORDS)
+        consumer._on_speech_transcript(None, result=final(words, is_final=False))
+        self.assertEqual(consumer.dg_connection.connection.finalized, 1)
+
+    async def test_unfinished_interim_is_left_to_endpointing(self) -> None:
+        consumer = self.make_consumer()
+        consumer._on_speech_transcript(None, result=final("Hola amigos", is_final=False))
+        self.assertEqual(consumer.dg_connection.connection.finalized, 0)
@@ -1,10 +1,16 @@
-import os
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Tuple
+
 import httpx
 from groq import AsyncGroq
 
 # Idealmente, esto viene de settings.py o variables de entorno
 from translator.constants import GROQ_API_KEY, TRANSLATION_SYSTEM_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 class TranslationService:
     """Service handles text translation using the Groq API.
@@ -15,6 +21,9 @@ class TranslationService:
 
     """
 
+    # Max number of (source, target, text) translations kept in memory
+    CACHE_SIZE = 2048
+
     LANG_NAMES = {
         "en": "English",
         "es": "Spanish",
@@ -24,13 +33,37 @@ class TranslationService:
         "ja": "Japanese",
     }
 
+    # Cheap endpoint used to open a keep-alive TCP+TLS connection to Groq
+    WARMUP_URL = "https://api.groq.com/openai/v1/models"
+
     def __init__(self) -> None:
         """Initializes the TranslationService with Groq credentials."""
-        self.http_client = httpx.AsyncClient()
+        # HTTP/2 lets concurrent translations multiplex over a few warm sockets
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                keepalive_expiry=300.0,
+            ),
+            timeout=httpx.Timeout(10.0, connect=2.0),
+        )
         self.client = AsyncGroq(
             api_key=GROQ_API_KEY,
             http_client=self.http_client,
         )
+        # LRU of recent translations: repeated phrases skip the Groq round trip
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+
+    async def warm(self) -> None:
+        """Opens a keep-alive connection to Groq ahead of the first translation."""
+        try:
+            await self.http_client.head(
+                self.WARMUP_URL,
+                headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            )
+        except httpx.HTTPError as e:
+            logger.warning("Groq warm-up failed: %s", e)
 
     async def translate(self, text: str, source_lang: str = "es", target_lang: str = "en") -> str:
         """Translates text from source language to target language.
@@ -44,26 +77,82 @@ class TranslationService:
             str: The translated text.
 
         """
-        # Convert "fr" -> "French" for better LLM context
-        target_name = self.LANG_NAMES.get(target_lang, "English")
-        system_prompt = TRANSLATION_SYSTEM_PROMPT.format(target_name=target_name)
+        return "".join([
+            delta async for delta in self.translate_stream(text, source_lang, target_lang)
+        ])
+
+    async def translate_stream(
+        self, text: str, source_lang: str = "es", target_lang: str = "en"
+    ) -> AsyncIterator[str]:
+        """Translates text, yielding the translation as Groq streams it.
 
+        Args:
+            text (str): The text to translate.
+            source_lang (str): The source language code.
+            target_lang (str): The target language code.
+
+        Yields:
+            str: Successive fragments of the translated text.
+
+        """
+        if source_lang == target_lang:
+            yield text
+            return
+
+        key = (source_lang, target_lang, text.strip().lower())
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            yield cached
+            return
+
+        # Prompt for "fr" names "French" for better LLM context
+        system_message = SYSTEM_MESSAGES.get(target_lang, SYSTEM_MESSAGES["en"])
+
+        parts: List[str] = []
         try:
-            chat_completion = await self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    system_message,
                     {"role": "user", "content": text},
                 ],
                 model="llama-3.3-70b-versatile",
                 temperature=0.3,
                 max_tokens=1024,
+                stream=True,
             )
-            content = chat_completion.choices[0].message.content
-            return content if content else text
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
         except Exception as e:
-            print(f"Groq Error: {e}")
-            return text # Fallback: return original if fails
+            logger.warning("Groq Error: %s", e)
+            if not parts:
+                yield text # Fallback: return original if fails
+            return
+
+        if not parts:
+            yield text
+            return
+
+        self._cache[key] = "".join(parts)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
     
     async def close(self) -> None:
         """Closes the HTTP client resources."""
         await self.http_client.aclose()
+
+
+# System message per target language, built once instead of formatted per call
+SYSTEM_MESSAGES: Dict[str, Dict[str, str]] = {
+    code: {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT.format(target_name=name)}
+    for code, name in TranslationService.LANG_NAMES.items()
+}
+
+
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    """Returns the process-wide TranslationService shared by all consumers."""
+    return TranslationService()